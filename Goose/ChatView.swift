@@ -11,7 +11,12 @@ struct ChatView: View {
     @State private var showingErrorDetails = false
     @State private var activeToolCalls: [String: ToolCallWithTiming] = [:]
     @State private var completedToolCalls: [String: CompletedToolCall] = [:]
-    @State private var toolCallMessageMap: [String: String] = [:]
+    @State private var toolCallMessageMap: [String: String] = [:] {
+        didSet { toolCallIdsByMessage = Self.indexToolCalls(toolCallMessageMap) }
+    }
+    // Reverse of toolCallMessageMap, rebuilt only when the map changes so renders
+    // don't rescan and re-sort the whole map for every message
+    @State private var toolCallIdsByMessage: [String: [String]] = [:]
     @State private var currentSessionId: String?
     @State private var sessionName: String?  // Store session name/description
     @State private var isSettingsPresented = false
@@ -835,9 +840,17 @@ struct ChatView: View {
             let maxNoChangeChecks = 10  // 10 checks with no change = ~20 seconds
             var lastHash = initialHash
 
+            // Schedule polls against a monotonic deadline so request latency
+            // doesn't stretch the effective interval between polls
+            let clock = ContinuousClock()
+            var nextPoll = clock.now
+
             while !Task.isCancelled && noChangeCount < maxNoChangeChecks {
-                // Wait before next poll
-                try? await Task.sleep(nanoseconds: UInt64(pollInterval * 1_000_000_000))
+                // Wait for the next deadline, but always leave at least half an interval
+                // after the last response so slow fetches don't run back to back and
+                // the backoff still eases load on the server and radio
+                nextPoll = max(nextPoll + .seconds(pollInterval), clock.now + .seconds(pollInterval / 2))
+                try? await Task.sleep(until: nextPoll, clock: clock)
 
                 guard !Task.isCancelled else { break }
 
@@ -936,8 +949,9 @@ struct ChatView: View {
         var newCompletedToolCalls: [String: CompletedToolCall] = [:]
         var newToolCallMessageMap: [String: String] = [:]
 
-        // Track which tool requests have responses
-        var toolRequestIds = Set<String>()
+        // Track which tool requests have responses, and where each request lives
+        // so responses don't have to search every message to find their request
+        var toolRequests: [String: (request: ToolRequestContent, message: Message)] = [:]
         var toolResponseIds = Set<String>()
 
         // First pass: collect all IDs
@@ -945,7 +959,9 @@ struct ChatView: View {
             for content in message.content {
                 switch content {
                 case .toolRequest(let toolRequest):
-                    toolRequestIds.insert(toolRequest.id)
+                    if toolRequests[toolRequest.id] == nil {
+                        toolRequests[toolRequest.id] = (toolRequest, message)
+                    }
                 case .toolResponse(let toolResponse):
                     toolResponseIds.insert(toolResponse.id)
                 default:
@@ -972,38 +988,23 @@ struct ChatView: View {
 
                 case .toolResponse(let toolResponse):
                     // Find the corresponding request
-                    if let requestMessage = messages.first(where: { msg in
-                        msg.content.contains(where: { c in
-                            if case .toolRequest(let tr) = c, tr.id == toolResponse.id {
-                                return true
-                            }
-                            return false
-                        })
-                    }) {
-                        // Find the tool call from request
-                        if let requestContent = requestMessage.content.first(where: { c in
-                            if case .toolRequest(let tr) = c, tr.id == toolResponse.id {
-                                return true
-                            }
-                            return false
-                        }),
-                            case .toolRequest(let toolRequest) = requestContent
-                        {
+                    if let entry = toolRequests[toolResponse.id] {
+                        let toolRequest = entry.request
+                        let requestMessage = entry.message
 
-                            let startTime = Date(
-                                timeIntervalSince1970: TimeInterval(requestMessage.created) / 1000.0
-                            )
-                            let endTime = Date(
-                                timeIntervalSince1970: TimeInterval(message.created) / 1000.0)
-                            let duration = endTime.timeIntervalSince(startTime)
+                        let startTime = Date(
+                            timeIntervalSince1970: TimeInterval(requestMessage.created) / 1000.0
+                        )
+                        let endTime = Date(
+                            timeIntervalSince1970: TimeInterval(message.created) / 1000.0)
+                        let duration = endTime.timeIntervalSince(startTime)
 
-                            newCompletedToolCalls[toolResponse.id] = CompletedToolCall(
-                                toolCall: toolRequest.toolCall,
-                                result: toolResponse.toolResult,
-                                duration: duration,
-                                completedAt: endTime
-                            )
-                        }
+                        newCompletedToolCalls[toolResponse.id] = CompletedToolCall(
+                            toolCall: toolRequest.toolCall,
+                            result: toolResponse.toolResult,
+                            duration: duration,
+                            completedAt: endTime
+                        )
                     }
 
                 default:
@@ -1044,9 +1045,16 @@ struct ChatView: View {
     }
 
     private func getToolCallsForMessage(_ messageId: String) -> [String] {
-        return toolCallMessageMap.compactMap { (toolCallId, mappedMessageId) in
-            mappedMessageId == messageId ? toolCallId : nil
-        }.sorted()
+        return toolCallIdsByMessage[messageId] ?? []
+    }
+
+    /// Group tool call IDs by the message that issued them, sorted within each message
+    private static func indexToolCalls(_ toolCallMessageMap: [String: String]) -> [String: [String]] {
+        var index: [String: [String]] = [:]
+        for (toolCallId, messageId) in toolCallMessageMap {
+            index[messageId, default: []].append(toolCallId)
+        }
+        return index.mapValues { $0.sorted() }
     }
 
     private func getCompletedTasksForMessage(_ messageId: String) -> [CompletedToolCall] {
@@ -1180,13 +1188,11 @@ struct ChatView: View {
         let messagesToRemove = messages.count - maxMessages
         let startIndex = messages.count > 1 ? 1 : 0  // Keep first message if exists
 
-        let removedMessages = Array(messages[startIndex..<startIndex + messagesToRemove])
+        let removedIds = Set(messages[startIndex..<startIndex + messagesToRemove].map { $0.id })
         messages.removeSubrange(startIndex..<startIndex + messagesToRemove)
 
-        // Clean up tool call mappings for removed messages
-        for removedMessage in removedMessages {
-            toolCallMessageMap = toolCallMessageMap.filter { $0.value != removedMessage.id }
-        }
+        // Clean up tool call mappings for removed messages in a single pass
+        toolCallMessageMap = toolCallMessageMap.filter { !removedIds.contains($0.value) }
 
     }
 
@@ -1197,11 +1203,10 @@ struct ChatView: View {
         let toolCallsToRemove = completedToolCalls.count - maxToolCalls
         let sortedCalls = completedToolCalls.sorted { $0.value.completedAt < $1.value.completedAt }
 
-        for i in 0..<toolCallsToRemove {
-            let toolCallId = sortedCalls[i].key
-            completedToolCalls.removeValue(forKey: toolCallId)
-            toolCallMessageMap.removeValue(forKey: toolCallId)
-        }
+        let removedIds = Set(sortedCalls.prefix(toolCallsToRemove).map { $0.key })
+        completedToolCalls = completedToolCalls.filter { !removedIds.contains($0.key) }
+        // Assign once so the tool call index is rebuilt once, not per removed call
+        toolCallMessageMap = toolCallMessageMap.filter { !removedIds.contains($0.key) }
 
     }
 
@@ -1374,6 +1379,16 @@ struct ChatSession: Identifiable, Codable, Equatable {
     let createdAt: String
     let updatedAt: String
     let workingDir: String?
+    
+    /// `updatedAt` parsed once at construction so views that filter, sort and
+    /// group sessions on every render don't re-parse the ISO 8601 string
+    let updatedDate: Date?
+    
+    private static let iso8601Formatter: ISO8601DateFormatter = {
+        let formatter = ISO8601DateFormatter()
+        formatter.formatOptions = [.withInternetDateTime]
+        return formatter
+    }()
 
     enum CodingKeys: String, CodingKey {
         case id
@@ -1393,6 +1408,7 @@ struct ChatSession: Identifiable, Codable, Equatable {
         self.createdAt = createdAt
         self.updatedAt = updatedAt
         self.workingDir = workingDir
+        self.updatedDate = Self.iso8601Formatter.date(from: updatedAt)
     }
     
     // Custom decoder to handle both 'name' and 'description' fields
@@ -1413,6 +1429,7 @@ struct ChatSession: Identifiable, Codable, Equatable {
         createdAt = try container.decode(String.self, forKey: .createdAt)
         updatedAt = try container.decode(String.self, forKey: .updatedAt)
         workingDir = try? container.decode(String.self, forKey: .workingDir)
+        updatedDate = Self.iso8601Formatter.date(from: updatedAt)
     }
     
     // Custom encoder to support both formats
@@ -1444,9 +1461,7 @@ struct ChatSession: Identifiable, Codable, Equatable {
     }
 
     var timestamp: Date {
-        // Parse the ISO 8601 date string
-        let formatter = ISO8601DateFormatter()
-        return formatter.date(from: updatedAt) ?? Date()
+        return updatedDate ?? Date()
     }
     
     // Extract just the directory name from the full path
@@ -119,7 +119,6 @@ class AgentStorage: ObservableObject {
     private func saveAgents() {
         guard let data = try? JSONEncoder().encode(savedAgents) else { return }
         UserDefaults.standard.set(data, forKey: agentsKey)
-        UserDefaults.standard.synchronize()
     }
     
     /// Load current agent ID
@@ -134,7 +133,6 @@ class AgentStorage: ObservableObject {
         } else {
             UserDefaults.standard.removeObject(forKey: currentAgentKey)
         }
-        UserDefaults.standard.synchronize()
     }
     
     /// Add or update an agent configuration
@@ -185,7 +183,6 @@ class AgentStorage: ObservableObject {
         // Apply to UserDefaults
         UserDefaults.standard.set(agent.url, forKey: "goose_base_url")
         UserDefaults.standard.set(agent.secret, forKey: "goose_secret_key")
-        UserDefaults.standard.synchronize()
         
         // Notify that configuration changed
         NotificationCenter.default.post(name: Notification.Name("RefreshSessions"), object: nil)
@@ -339,7 +336,6 @@ class ConfigurationHandler: ObservableObject {
         // Save to UserDefaults
         UserDefaults.standard.set(baseURL, forKey: "goose_base_url")
         UserDefaults.standard.set(config.secret, forKey: "goose_secret_key")
-        UserDefaults.standard.synchronize()
         
         // Test the connection
         Task {
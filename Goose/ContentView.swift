@@ -69,11 +69,8 @@ struct ContentView: View {
             let now = Date()
             let cutoffDate = calendar.date(byAdding: .day, value: -daysBack, to: now) ?? now
             
-            let formatter = ISO8601DateFormatter()
-            formatter.formatOptions = [.withInternetDateTime]
-            
             return sessions.filter { session in
-                guard let sessionDate = formatter.date(from: session.updatedAt) else {
+                guard let sessionDate = session.updatedDate else {
                     return false
                 }
                 return sessionDate >= cutoffDate
@@ -85,10 +82,7 @@ struct ContentView: View {
     private func calculateDaysLoaded(from sessions: [ChatSession]) -> Int {
         guard let oldestSession = sessions.last else { return initialDaysBack }
         
-        let formatter = ISO8601DateFormatter()
-        formatter.formatOptions = [.withInternetDateTime]
-        
-        guard let oldestDate = formatter.date(from: oldestSession.updatedAt) else {
+        guard let oldestDate = oldestSession.updatedDate else {
             return initialDaysBack
         }
         
@@ -318,71 +312,29 @@ struct ContentView: View {
         
         switch result {
         case .success(let fetchedSessions):
-            await MainActor.run {
-                // In trial mode, show all sessions without filtering
-                if GooseAPIService.shared.isTrialMode {
+            // In trial mode, show all sessions without filtering
+            if GooseAPIService.shared.isTrialMode {
+                await MainActor.run {
                     self.cachedSessions = fetchedSessions
                     self.currentDaysLoaded = initialDaysBack
                     self.hasMoreSessions = false  // No pagination in trial mode
                     print("✅ Loaded \(fetchedSessions.count) trial mode sessions")
-                    return
-                }
-                
-                // Use UTC calendar for date comparison to match session timestamps
-                let calendar = Calendar.current  // Use local timezone
-                let now = Date()
-                let cutoffDate = calendar.date(byAdding: .day, value: -initialDaysBack, to: now) ?? now
-                
-                let formatter = ISO8601DateFormatter()
-                formatter.formatOptions = [.withInternetDateTime]
-                
-                
-                // Check for duplicate session IDs
-                let sessionIds = fetchedSessions.map { $0.id }
-                let uniqueIds = Set(sessionIds)
-                if sessionIds.count != uniqueIds.count {
-                    print("⚠️ DEBUG: DUPLICATE SESSION IDs DETECTED!")
                 }
-                
-                // Show ALL sessions from last 7 days for debugging
-                let sevenDaysAgo = calendar.date(byAdding: .day, value: -7, to: now) ?? now
-                let recentForDebug = fetchedSessions.filter { session in
-                    guard let sessionDate = formatter.date(from: session.updatedAt) else { return false }
-                    return sessionDate >= sevenDaysAgo
-                }
-                
-                let dayFormatter = DateFormatter()
-                dayFormatter.dateFormat = "yyyy-MM-dd (EEEE)"
-                dayFormatter.timeZone = TimeZone(identifier: "UTC")
-                
-                for session in recentForDebug.sorted(by: { $0.updatedAt > $1.updatedAt }) {
-                    if let date = formatter.date(from: session.updatedAt) {
-                        let dayStr = dayFormatter.string(from: date)
-                        let desc = session.description.isEmpty ? "[Untitled]" : session.description
-                    }
-                }
-                
-                var includedCount = 0
-                var filteredCount = 0
-                var parseErrors = 0
-                
-                let recentSessions = fetchedSessions.filter { session in
-                    guard let sessionDate = formatter.date(from: session.updatedAt) else {
-                        print("⚠️ DEBUG: Failed to parse date: \(session.updatedAt) for session: \(session.description)")
-                        parseErrors += 1
-                        return false
-                    }
-                    
-                    let isIncluded = sessionDate >= cutoffDate
-                    if isIncluded {
-                        includedCount += 1
-                    } else {
-                        filteredCount += 1
-                    }
-                    
-                    return isIncluded
-                }
-                
+                return
+            }
+            
+            // Check for duplicate session IDs
+            let sessionIds = fetchedSessions.map { $0.id }
+            let uniqueIds = Set(sessionIds)
+            if sessionIds.count != uniqueIds.count {
+                print("⚠️ DEBUG: DUPLICATE SESSION IDs DETECTED!")
+            }
+            
+            // Filter sessions on background thread - parsing every date on the
+            // main actor stalls the UI on launch for long session histories
+            let recentSessions = await filterSessionsByDate(fetchedSessions, daysBack: initialDaysBack)
+            
+            await MainActor.run {
                 // Load all sessions within the initial time window
                 self.cachedSessions = recentSessions
                 self.currentDaysLoaded = initialDaysBack
@@ -390,15 +342,6 @@ struct ContentView: View {
                 
                 print("   - Older sessions available: \(fetchedSessions.count - recentSessions.count)")
                 
-                // Show what we actually loaded
-                let groupedByDate = Dictionary(grouping: recentSessions) { session -> String in
-                    guard let date = formatter.date(from: session.updatedAt) else { return "unknown" }
-                    return dayFormatter.string(from: date)
-                }
-                for (date, sessions) in groupedByDate.sorted(by: { $0.key > $1.key }) {
-                    print("   \(date): \(sessions.count) sessions")
-                }
-                
                 if self.cachedSessions.isEmpty {
                     print("⚠️ No sessions preloaded - server may not be connected or no sessions exist")
                 }
@@ -16,9 +16,9 @@ class Ed25519Signer {
         self.privateKey = key
     }
     
-    func sign(method: String, path: String, body: String?) -> String {
+    func sign(method: String, path: String, body: Data?) -> String {
         let timestamp = Int(Date().timeIntervalSince1970)
-        let bodyHash = body.map { SHA256.hash(data: $0.data(using: .utf8)!).hexString } ?? ""
+        let bodyHash = body.map { SHA256.hash(data: $0).hexString } ?? ""
         let message = "\(method)|\(path)|\(timestamp)|\(bodyHash)"
         let signature = try! privateKey.signature(for: message.data(using: .utf8)!)
         return "\(timestamp).\(signature.hexString)"
@@ -44,12 +44,25 @@ extension Data {
     }
     
     var hexString: String {
-        map { String(format: "%02hhx", $0) }.joined()
+        hexEncode(self)
     }
 }
 
 extension SHA256.Digest {
     var hexString: String {
-        map { String(format: "%02hhx", $0) }.joined()
+        hexEncode(self)
     }
 }
+
+private let hexDigits = Array("0123456789abcdef".utf8)
+
+/// Lowercase hex via a digit table instead of a String(format:) per byte
+private func hexEncode<S: Sequence>(_ bytes: S) -> String where S.Element == UInt8 {
+    var chars: [UInt8] = []
+    chars.reserveCapacity(bytes.underestimatedCount * 2)
+    for byte in bytes {
+        chars.append(hexDigits[Int(byte >> 4)])
+        chars.append(hexDigits[Int(byte & 0x0f)])
+    }
+    return String(decoding: chars, as: UTF8.self)
+}
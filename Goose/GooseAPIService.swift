@@ -63,8 +63,8 @@ class GooseAPIService: ObservableObject {
             }
         }
         
-        let bodyString = request.httpBody.flatMap { String(data: $0, encoding: .utf8) }
-        let signature = signer.sign(method: method, path: path, body: bodyString)
+        // Hash the body bytes directly - chat requests carry the whole conversation
+        let signature = signer.sign(method: method, path: path, body: request.httpBody)
         request.setValue(signature, forHTTPHeaderField: "X-Corp-Signature")
     }
     
@@ -195,16 +195,7 @@ class GooseAPIService: ObservableObject {
 
             // Debug logging
             if let bodyString = String(data: requestData, encoding: .utf8) {
-                if let jsonData = bodyString.data(using: .utf8),
-                    let prettyJson = try? JSONSerialization.jsonObject(with: jsonData),
-                    let prettyData = try? JSONSerialization.data(
-                        withJSONObject: prettyJson, options: .prettyPrinted),
-                    let prettyString = String(data: prettyData, encoding: .utf8)
-                {
-                    print(prettyString)
-                } else {
-                    print(bodyString)
-                }
+                print(bodyString)
             }
         } catch {
             onError(error)
@@ -771,9 +762,11 @@ class SSEDelegate: NSObject, URLSessionDataDelegate {
     private let onEvent: (SSEEvent) -> Void
     private let onComplete: () -> Void
     private let onError: (Error) -> Void
-    private var buffer = ""
+    private var buffer = Data()  // Raw bytes not yet split into complete lines
     private let maxBufferSize = 10000  // Prevent buffer overflow
     private var errorStatusCode: Int? = nil  // Track error status codes
+    private let decoder = JSONDecoder()  // Reused for every event; delegate callbacks are serial
+    private static let dataPrefix = Data("data: ".utf8)  // SSE payload line marker
 
     init(
         onEvent: @escaping (SSEEvent) -> Void, onComplete: @escaping () -> Void,
@@ -809,26 +802,42 @@ class SSEDelegate: NSObject, URLSessionDataDelegate {
     }
 
     func urlSession(_ session: URLSession, dataTask: URLSessionDataTask, didReceive data: Data) {
-        guard let string = String(data: data, encoding: .utf8) else {
-            print("🚨 SSE: Failed to decode data as UTF-8")
+        // Error responses aren't SSE - keep the start of the body for the error report,
+        // capped so a large error page isn't held in memory or shown in full
+        guard errorStatusCode == nil else {
+            buffer.append(data.prefix(max(0, maxBufferSize - buffer.count)))
             return
         }
 
         // Add to buffer
-        buffer += string
+        buffer.append(data)
+
+        // Split off complete lines and pick out the `data: ` payloads as byte slices,
+        // so JSON is decoded straight from the buffer without building Strings.
+        // The trailing partial line (including a multi-byte character split across
+        // chunks) stays buffered
+        var payloads: [Data] = []
+        var lineStart = buffer.startIndex
+        while let newline = buffer[lineStart...].firstIndex(of: UInt8(ascii: "\n")) {
+            var lineEnd = newline
+            if lineEnd > lineStart && buffer[lineEnd - 1] == UInt8(ascii: "\r") {
+                lineEnd -= 1
+            }
+            let line = buffer[lineStart..<lineEnd]
+            if line.starts(with: Self.dataPrefix) {
+                let payload = line.dropFirst(Self.dataPrefix.count)
+                if !payload.isEmpty {
+                    payloads.append(payload)
+                }
+            }
+            lineStart = newline + 1
+        }
 
-        // Process complete lines
-        let lines = buffer.components(separatedBy: .newlines)
+        // Decode before trimming so the slices still point at the buffer's bytes
+        processSSEPayloads(payloads)
 
         // Keep the last incomplete line in buffer
-        if !buffer.hasSuffix("\n") && !buffer.hasSuffix("\r\n") {
-            buffer = lines.last ?? ""
-            let completeLines = Array(lines.dropLast())
-            processSSELines(completeLines)
-        } else {
-            buffer = ""
-            processSSELines(lines)
-        }
+        buffer.removeSubrange(buffer.startIndex..<lineStart)
     }
 
     func urlSession(
@@ -843,9 +852,11 @@ class SSEDelegate: NSObject, URLSessionDataDelegate {
             }
         } else if let statusCode = errorStatusCode {
             // We had an HTTP error - report it with the collected buffer as the error body
-            print("🚨 HTTP Error \(statusCode) with body: \(buffer)")
+            // Snapshot it here rather than reading the mutable buffer from the main queue
+            let errorBody = String(decoding: buffer, as: UTF8.self)
+            print("🚨 HTTP Error \(statusCode) with body: \(errorBody)")
             DispatchQueue.main.async {
-                self.onError(APIError.httpError(statusCode, self.buffer))
+                self.onError(APIError.httpError(statusCode, errorBody))
             }
         } else {
             DispatchQueue.main.async {
@@ -854,41 +865,50 @@ class SSEDelegate: NSObject, URLSessionDataDelegate {
         }
     }
 
-    private func processSSELines(_ lines: [String]) {
-        for line in lines {
-            if line.hasPrefix("data: ") {
-                let eventData = String(line.dropFirst(6))
-                if !eventData.isEmpty {
-                    do {
-                        let jsonData = eventData.data(using: .utf8)!
-                        let event = try JSONDecoder().decode(SSEEvent.self, from: jsonData)
-
-                        // Minimal logging - only log important events
-                        if case .finish = event {
-                        } else if case .error = event {
-                            print("🚨 SSE Error event received")
-                        }
+    private func processSSEPayloads(_ payloads: [Data]) {
+        // Decode every event in the chunk first, then deliver them in order with a
+        // single main queue hop instead of one hop per event line
+        var results: [Result<SSEEvent, Error>] = []
+        var finished = false
 
-                        DispatchQueue.main.async {
-                            self.onEvent(event)
-                        }
+        for payload in payloads {
+            do {
+                let event = try decoder.decode(SSEEvent.self, from: payload)
 
-                        // Check if this is a finish event
-                        if case .finish = event {
-                            DispatchQueue.main.async {
-                                self.onComplete()
-                            }
-                            return
-                        }
-                    } catch {
-                        // Errors are handled by earlier API calls
-                        print("🚨 Failed to decode SSE event: \(error)")
-                        DispatchQueue.main.async {
-                            self.onError(error)
-                        }
-                    }
+                // Minimal logging - only log important events
+                if case .finish = event {
+                } else if case .error = event {
+                    print("🚨 SSE Error event received")
+                }
+
+                results.append(.success(event))
+
+                // Check if this is a finish event
+                if case .finish = event {
+                    finished = true
+                    break
+                }
+            } catch {
+                // Errors are handled by earlier API calls
+                print("🚨 Failed to decode SSE event: \(error)")
+                results.append(.failure(error))
+            }
+        }
+
+        guard !results.isEmpty else { return }
+
+        DispatchQueue.main.async {
+            for result in results {
+                switch result {
+                case .success(let event):
+                    self.onEvent(event)
+                case .failure(let error):
+                    self.onError(error)
                 }
             }
+            if finished {
+                self.onComplete()
+            }
         }
     }
 }
@@ -32,7 +32,6 @@ struct GooseApp: App {
             print("🎯 First launch detected - setting demo defaults")
             UserDefaults.standard.set("https://demo-goosed.fly.dev", forKey: "goose_base_url")
             UserDefaults.standard.set("test", forKey: "goose_secret_key")
-            UserDefaults.standard.synchronize()
         }
     }
 }
@@ -17,14 +17,6 @@ struct NodeMatrix: View {
     @State private var geometrySize: CGSize = .zero
     @State private var favoritePulse = false
     
-    // MARK: - Shared Date Formatter
-    /// Reusable date formatter to avoid expensive recreation
-    private static let dateFormatter: ISO8601DateFormatter = {
-        let formatter = ISO8601DateFormatter()
-        formatter.formatOptions = [.withInternetDateTime]
-        return formatter
-    }()
-    
 // MARK: - Position Cache
 /// Cache structure: [cacheKey: [sessionId: position]]
 /// cacheKey format: "dateLabel-widthxheight"
@@ -45,7 +37,7 @@ struct NodeMatrix: View {
     // MARK: - Live Session Detection
     /// Check if a session is "live" (updated within last 5 minutes)
     private func isSessionLive(_ session: ChatSession) -> Bool {
-        guard let sessionDate = Self.dateFormatter.date(from: session.updatedAt) else {
+        guard let sessionDate = session.updatedDate else {
             return false
         }
         
@@ -103,7 +95,7 @@ struct NodeMatrix: View {
         let target = targetDate(for: offset)
         
         let filtered = sessions.filter { session in
-            guard let sessionDate = Self.dateFormatter.date(from: session.updatedAt) else {
+            guard let sessionDate = session.updatedDate else {
                 return false
             }
             
@@ -111,8 +103,8 @@ struct NodeMatrix: View {
         }
         
         let sorted = filtered.sorted { session1, session2 in
-            guard let date1 = Self.dateFormatter.date(from: session1.updatedAt),
-                  let date2 = Self.dateFormatter.date(from: session2.updatedAt) else {
+            guard let date1 = session1.updatedDate,
+                  let date2 = session2.updatedDate else {
                 return false
             }
             return date1 < date2
@@ -137,7 +129,7 @@ struct NodeMatrix: View {
         let target = targetDate(for: offset)
         
         let filtered = sessions.filter { session in
-            guard let sessionDate = Self.dateFormatter.date(from: session.updatedAt) else {
+            guard let sessionDate = session.updatedDate else {
                 return false
             }
             
@@ -145,8 +137,8 @@ struct NodeMatrix: View {
         }
         
         let sorted = filtered.sorted { session1, session2 in
-            guard let date1 = Self.dateFormatter.date(from: session1.updatedAt),
-                  let date2 = Self.dateFormatter.date(from: session2.updatedAt) else {
+            guard let date1 = session1.updatedDate,
+                  let date2 = session2.updatedDate else {
                 return false
             }
             return date1 < date2
@@ -159,18 +151,23 @@ struct NodeMatrix: View {
         print("💾 Cached \(limited.count) sessions for day offset \(offset)")
     }
     
+    // Static label formatter to avoid recreating on every render
+    private static let dateLabelFormatter: DateFormatter = {
+        let formatter = DateFormatter()
+        formatter.dateStyle = .medium
+        return formatter
+    }()
+    
     private func dateLabel(for offset: Int) -> String {
         let calendar = Calendar.current  // Use local timezone
         let target = targetDate(for: offset)
-        let formatter = DateFormatter()
         
         if calendar.isDateInToday(target) {
             return "Today"
         } else if calendar.isDateInYesterday(target) {
             return "Yesterday"
         } else {
-            formatter.dateStyle = .medium
-            return formatter.string(from: target)
+            return Self.dateLabelFormatter.string(from: target)
         }
     }
     
@@ -514,14 +511,11 @@ struct NodeMatrix: View {
             return CGPoint(x: size.width / 2, y: size.height / 2)
         }
         
-        let formatter = ISO8601DateFormatter()
-        formatter.formatOptions = [.withInternetDateTime]
-        
-        guard let sessionDate = formatter.date(from: session.updatedAt) else {
+        guard let sessionDate = session.updatedDate else {
             return randomPosition(seed: session.id.hashValue, in: size, paddingX: paddingX, paddingY: paddingY)
         }
         
-        let dates = allSessions.compactMap { formatter.date(from: $0.updatedAt) }
+        let dates = allSessions.compactMap { $0.updatedDate }
         guard let minDate = dates.min(), let maxDate = dates.max() else {
             return randomPosition(seed: session.id.hashValue, in: size, paddingX: paddingX, paddingY: paddingY)
         }
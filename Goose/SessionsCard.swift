@@ -15,28 +15,26 @@ struct SessionsCard: View {
         Color(red: 0.98, green: 0.98, blue: 0.99)
     }
     
+    // Static display formatter to avoid recreating on every render
+    private static let displayFormatter: DateFormatter = {
+        let formatter = DateFormatter()
+        formatter.dateStyle = .medium
+        formatter.timeStyle = .short
+        return formatter
+    }()
+    
     // Format timestamp
     private var formattedTimestamp: String {
-        let formatter = ISO8601DateFormatter()
-        formatter.formatOptions = [.withInternetDateTime]
-        
-        guard let sessionDate = formatter.date(from: session.updatedAt) else {
+        guard let sessionDate = session.updatedDate else {
             return session.updatedAt
         }
         
-        let displayFormatter = DateFormatter()
-        displayFormatter.dateStyle = .medium
-        displayFormatter.timeStyle = .short
-        
-        return displayFormatter.string(from: sessionDate)
+        return Self.displayFormatter.string(from: sessionDate)
     }
     
     // Calculate time ago
     private var timeAgo: String {
-        let formatter = ISO8601DateFormatter()
-        formatter.formatOptions = [.withInternetDateTime]
-        
-        guard let sessionDate = formatter.date(from: session.updatedAt) else {
+        guard let sessionDate = session.updatedDate else {
             return ""
         }
         
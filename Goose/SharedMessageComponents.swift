@@ -33,10 +33,36 @@ private enum RegexCache {
     static let cssProperty = try! NSRegularExpression(pattern: #"[\w-]+(?=\s*:)"#, options: [])
     static let cssColor = try! NSRegularExpression(pattern: #"#[0-9a-fA-F]{3,6}"#, options: [])
     static let jsonProperty = try! NSRegularExpression(pattern: #""([^"]+)"\s*:"#, options: [])
+    static let arrowFunction = try! NSRegularExpression(pattern: #"\b=>\b"#, options: [])
     
-    // Helper to create word boundary patterns dynamically
-    static func wordBoundaryPattern(_ word: String) -> NSRegularExpression {
-        return try! NSRegularExpression(pattern: "\\b" + NSRegularExpression.escapedPattern(for: word) + "\\b", options: [])
+    // Word list alternations compiled on first use, keyed by the joined word list
+    private static let wordListCache = NSCache<NSString, NSRegularExpression>()
+    
+    // Helper to create one word boundary pattern matching any word in a list
+    static func wordBoundaryPattern(anyOf words: [String]) -> NSRegularExpression {
+        let key = words.joined(separator: "\n") as NSString
+        if let cached = wordListCache.object(forKey: key) {
+            return cached
+        }
+        let alternatives = words.map { NSRegularExpression.escapedPattern(for: $0) }.joined(separator: "|")
+        let regex = try! NSRegularExpression(pattern: "\\b(?:" + alternatives + ")\\b", options: [])
+        wordListCache.setObject(regex, forKey: key)
+        return regex
+    }
+    
+    // Function name alternations compiled on first use, keyed by the joined name list
+    private static let functionNameCache = NSCache<NSString, NSRegularExpression>()
+    
+    // Helper to create one pattern matching any listed name directly followed by a call paren
+    static func functionCallPattern(anyOf names: [String]) -> NSRegularExpression {
+        let key = names.joined(separator: "\n") as NSString
+        if let cached = functionNameCache.object(forKey: key) {
+            return cached
+        }
+        let alternatives = names.map { NSRegularExpression.escapedPattern(for: $0) }.joined(separator: "|")
+        let regex = try! NSRegularExpression(pattern: "\\b(?:" + alternatives + ")(?=\\()", options: [])
+        functionNameCache.setObject(regex, forKey: key)
+        return regex
     }
 }
 
@@ -658,14 +684,10 @@ struct SyntaxHighlighter {
         let types = ["String", "Int", "Double", "Float", "Bool", "Array", "Dictionary", "Set", "Optional", "Any", "AnyObject", "Void", "Self"]
         
         // Highlight keywords
-        for keyword in keywords {
-            highlightPattern(keyword, in: &attributedString, color: .purple, bold: true)
-        }
+        highlightWords(keywords, in: &attributedString, color: .purple, bold: true)
         
         // Highlight types
-        for type in types {
-            highlightPattern(type, in: &attributedString, color: Color(red: 0.0, green: 0.5, blue: 0.7))
-        }
+        highlightWords(types, in: &attributedString, color: Color(red: 0.0, green: 0.5, blue: 0.7))
         
         // Highlight strings
         highlightStrings(&attributedString, code)
@@ -675,24 +697,17 @@ struct SyntaxHighlighter {
         
         // Highlight numbers
         highlightNumbers(&attributedString, code)
-        
-        // Highlight function/method calls
-        highlightPattern(#"(\w+)\s*\("#, in: &attributedString, color: Color(red: 0.0, green: 0.6, blue: 0.4))
     }
     
     // MARK: - Python Highlighting
     private static func highlightPython(_ attributedString: inout AttributedString, _ code: String) {
         let keywords = ["def", "class", "if", "elif", "else", "for", "while", "return", "import", "from", "as", "try", "except", "finally", "with", "lambda", "pass", "break", "continue", "global", "nonlocal", "assert", "yield", "raise", "del", "is", "not", "and", "or", "in", "True", "False", "None", "async", "await"]
         
-        for keyword in keywords {
-            highlightPattern(keyword, in: &attributedString, color: .purple, bold: true)
-        }
+        highlightWords(keywords, in: &attributedString, color: .purple, bold: true)
         
         // Highlight built-in functions
         let builtins = ["print", "len", "range", "int", "str", "float", "list", "dict", "set", "tuple", "bool", "type", "isinstance", "open", "input", "sum", "min", "max", "abs", "round", "zip", "map", "filter"]
-        for builtin in builtins {
-            highlightPattern(builtin + #"(?=\()"#, in: &attributedString, color: Color(red: 0.0, green: 0.6, blue: 0.6))
-        }
+        highlightRegex(RegexCache.functionCallPattern(anyOf: builtins), in: &attributedString, color: Color(red: 0.0, green: 0.6, blue: 0.6))
         
         highlightStrings(&attributedString, code)
         highlightComments(&attributedString, code, commentPrefix: "#")
@@ -706,42 +721,24 @@ struct SyntaxHighlighter {
     private static func highlightJavaScript(_ attributedString: inout AttributedString, _ code: String) {
         let keywords = ["function", "var", "let", "const", "if", "else", "for", "while", "return", "class", "extends", "new", "this", "super", "import", "export", "default", "from", "async", "await", "try", "catch", "finally", "throw", "typeof", "instanceof", "delete", "void", "null", "undefined", "true", "false", "switch", "case", "break", "continue", "do"]
         
-        for keyword in keywords {
-            highlightPattern(keyword, in: &attributedString, color: .purple, bold: true)
-        }
+        highlightWords(keywords, in: &attributedString, color: .purple, bold: true)
         
         // Highlight built-in objects/methods
         let builtins = ["console", "document", "window", "Array", "Object", "String", "Number", "Boolean", "Promise", "Math", "Date", "JSON", "RegExp"]
-        for builtin in builtins {
-            highlightPattern(builtin, in: &attributedString, color: Color(red: 0.0, green: 0.5, blue: 0.7))
-        }
+        highlightWords(builtins, in: &attributedString, color: Color(red: 0.0, green: 0.5, blue: 0.7))
         
         highlightStrings(&attributedString, code)
         highlightComments(&attributedString, code)
         highlightNumbers(&attributedString, code)
         
         // Highlight arrow functions
-        highlightPattern("=>", in: &attributedString, color: .purple, bold: true)
+        highlightRegex(RegexCache.arrowFunction, in: &attributedString, color: .purple, bold: true)
     }
     
     // MARK: - Helper Functions
-    private static func highlightPattern(_ pattern: String, in attributedString: inout AttributedString, color: Color, bold: Bool = false) {
-        let string = String(attributedString.characters)
-        
-        let regex = RegexCache.wordBoundaryPattern(pattern)
-        let matches = regex.matches(in: string, options: [], range: NSRange(location: 0, length: string.count))
-        
-        for match in matches {
-            if let range = Range(match.range, in: string) {
-                let startIndex = attributedString.characters.index(attributedString.startIndex, offsetBy: match.range.location)
-                let endIndex = attributedString.characters.index(startIndex, offsetBy: match.range.length)
-                
-                attributedString[startIndex..<endIndex].foregroundColor = color
-                if bold {
-                    attributedString[startIndex..<endIndex].font = .system(size: 13, weight: .semibold, design: .monospaced)
-                }
-            }
-        }
+    /// Highlight every word in a list with one combined regex pass instead of one pass per word
+    private static func highlightWords(_ words: [String], in attributedString: inout AttributedString, color: Color, bold: Bool = false) {
+        highlightRegex(RegexCache.wordBoundaryPattern(anyOf: words), in: &attributedString, color: color, bold: bold)
     }
     
     private static func highlightStrings(_ attributedString: inout AttributedString, _ code: String) {
@@ -828,9 +825,7 @@ struct SyntaxHighlighter {
         highlightNumbers(&attributedString, code)
         
         // Highlight booleans and null
-        for keyword in ["true", "false", "null"] {
-            highlightPattern(keyword, in: &attributedString, color: .purple, bold: true)
-        }
+        highlightWords(["true", "false", "null"], in: &attributedString, color: .purple, bold: true)
     }
     
     // MARK: - SQL Highlighting
@@ -838,10 +833,7 @@ struct SyntaxHighlighter {
         let keywords = ["SELECT", "FROM", "WHERE", "INSERT", "INTO", "VALUES", "UPDATE", "SET", "DELETE", "CREATE", "TABLE", "ALTER", "DROP", "INDEX", "JOIN", "LEFT", "RIGHT", "INNER", "OUTER", "ON", "AS", "GROUP", "BY", "ORDER", "HAVING", "LIMIT", "OFFSET", "UNION", "ALL", "DISTINCT", "AND", "OR", "NOT", "NULL", "IS", "IN", "EXISTS", "BETWEEN", "LIKE", "PRIMARY", "KEY", "FOREIGN", "REFERENCES"]
         
         // SQL keywords are case-insensitive
-        for keyword in keywords {
-            highlightPattern(keyword, in: &attributedString, color: .blue, bold: true)
-            highlightPattern(keyword.lowercased(), in: &attributedString, color: .blue, bold: true)
-        }
+        highlightWords(keywords + keywords.map { $0.lowercased() }, in: &attributedString, color: .blue, bold: true)
         
         highlightStrings(&attributedString, code)
         highlightNumbers(&attributedString, code)
@@ -852,9 +844,7 @@ struct SyntaxHighlighter {
     private static func highlightShell(_ attributedString: inout AttributedString, _ code: String) {
         let keywords = ["if", "then", "else", "elif", "fi", "for", "do", "done", "while", "case", "esac", "function", "return", "export", "source", "alias", "echo", "cd", "ls", "grep", "sed", "awk", "curl", "wget", "chmod", "mkdir", "rm", "cp", "mv", "touch", "cat", "head", "tail", "find", "which", "sudo", "apt", "yum", "brew", "npm", "pip", "git"]
         
-        for keyword in keywords {
-            highlightPattern(keyword, in: &attributedString, color: .purple, bold: true)
-        }
+        highlightWords(keywords, in: &attributedString, color: .purple, bold: true)
         
         highlightStrings(&attributedString, code)
         highlightComments(&attributedString, code, commentPrefix: "#")
@@ -867,9 +857,7 @@ struct SyntaxHighlighter {
     private static func highlightRuby(_ attributedString: inout AttributedString, _ code: String) {
         let keywords = ["def", "class", "module", "if", "elsif", "else", "unless", "case", "when", "while", "until", "for", "do", "end", "return", "yield", "super", "self", "nil", "true", "false", "and", "or", "not", "begin", "rescue", "ensure", "retry", "break", "next", "redo", "require", "include", "extend", "attr_reader", "attr_writer", "attr_accessor"]
         
-        for keyword in keywords {
-            highlightPattern(keyword, in: &attributedString, color: .purple, bold: true)
-        }
+        highlightWords(keywords, in: &attributedString, color: .purple, bold: true)
         
         highlightStrings(&attributedString, code)
         highlightComments(&attributedString, code, commentPrefix: "#")
@@ -885,15 +873,11 @@ struct SyntaxHighlighter {
     private static func highlightGo(_ attributedString: inout AttributedString, _ code: String) {
         let keywords = ["package", "import", "func", "var", "const", "type", "struct", "interface", "if", "else", "for", "range", "switch", "case", "default", "return", "break", "continue", "goto", "defer", "go", "select", "chan", "map", "nil", "true", "false"]
         
-        for keyword in keywords {
-            highlightPattern(keyword, in: &attributedString, color: .purple, bold: true)
-        }
+        highlightWords(keywords, in: &attributedString, color: .purple, bold: true)
         
         // Highlight built-in functions
         let builtins = ["fmt", "Println", "Printf", "Sprintf", "make", "len", "cap", "append", "copy", "delete", "close", "panic", "recover", "new"]
-        for builtin in builtins {
-            highlightPattern(builtin, in: &attributedString, color: Color(red: 0.0, green: 0.6, blue: 0.6))
-        }
+        highlightWords(builtins, in: &attributedString, color: Color(red: 0.0, green: 0.6, blue: 0.6))
         
         highlightStrings(&attributedString, code)
         highlightComments(&attributedString, code)
@@ -903,15 +887,11 @@ struct SyntaxHighlighter {
     private static func highlightRust(_ attributedString: inout AttributedString, _ code: String) {
         let keywords = ["fn", "let", "mut", "const", "if", "else", "match", "for", "while", "loop", "return", "break", "continue", "struct", "enum", "trait", "impl", "pub", "mod", "use", "self", "super", "crate", "async", "await", "move", "ref", "as", "where", "unsafe", "static", "extern", "type", "true", "false", "Some", "None", "Ok", "Err"]
         
-        for keyword in keywords {
-            highlightPattern(keyword, in: &attributedString, color: .purple, bold: true)
-        }
+        highlightWords(keywords, in: &attributedString, color: .purple, bold: true)
         
         // Highlight types
         let types = ["i8", "i16", "i32", "i64", "i128", "u8", "u16", "u32", "u64", "u128", "f32", "f64", "bool", "char", "str", "String", "Vec", "Option", "Result", "Box", "Rc", "Arc"]
-        for type in types {
-            highlightPattern(type, in: &attributedString, color: Color(red: 0.0, green: 0.5, blue: 0.7))
-        }
+        highlightWords(types, in: &attributedString, color: Color(red: 0.0, green: 0.5, blue: 0.7))
         
         highlightStrings(&attributedString, code)
         highlightComments(&attributedString, code)
@@ -38,8 +38,7 @@ struct SidebarView: View {
             return []
         }
         
-        let formatter = ISO8601DateFormatter()
-        formatter.formatOptions = [.withInternetDateTime]
+        let formatter = Self.iso8601Formatter
         let now = Date()
         
         // Always add 2 fake sessions in trial mode
@@ -70,6 +69,13 @@ struct SidebarView: View {
         return formatter
     }()
     
+    // Static header formatter to avoid recreating per section
+    private static let dateHeaderFormatter: DateFormatter = {
+        let formatter = DateFormatter()
+        formatter.dateFormat = "EEEE, MMM d"
+        return formatter
+    }()
+    
     // Dynamic sidebar width based on device
     private var sidebarWidth: CGFloat {
         let screenWidth = UIScreen.main.bounds.width
@@ -87,10 +93,11 @@ struct SidebarView: View {
     
     // Group sessions by date for displaying with headers
     // Excludes favorited sessions to avoid duplication
-    private func groupSessionsByDate(sessions: [ChatSession]) -> [(String, [ChatSession])] {
+    // Takes a snapshot of favorite IDs since this runs off the main thread while
+    // FavoriteSessionsStorage is mutated on it
+    private func groupSessionsByDate(sessions: [ChatSession], favoriteIds: Set<String>) -> [(String, [ChatSession])] {
         let calendar = Calendar.current
         var groups: [Date: [ChatSession]] = [:]
-        let favoriteIds = favoritesStorage.favoriteSessionIds
         
         for session in sessions {
             // Skip favorited sessions - they're shown in FAVORITES section
@@ -98,7 +105,7 @@ struct SidebarView: View {
                 continue
             }
             
-            guard let sessionDate = Self.iso8601Formatter.date(from: session.updatedAt) else {
+            guard let sessionDate = session.updatedDate else {
                 continue
             }
             
@@ -113,8 +120,8 @@ struct SidebarView: View {
             let label = formatDateHeader(date)
             // Sort sessions within each group by updated time (newest first)
             let sortedSessions = sessions.sorted { s1, s2 in
-                guard let date1 = Self.iso8601Formatter.date(from: s1.updatedAt),
-                      let date2 = Self.iso8601Formatter.date(from: s2.updatedAt) else {
+                guard let date1 = s1.updatedDate,
+                      let date2 = s2.updatedDate else {
                     return false
                 }
                 return date1 > date2
@@ -131,9 +138,7 @@ struct SidebarView: View {
         } else if calendar.isDateInYesterday(date) {
             return "YESTERDAY"
         } else {
-            let formatter = DateFormatter()
-            formatter.dateFormat = "EEEE, MMM d"
-            return formatter.string(from: date).uppercased()
+            return Self.dateHeaderFormatter.string(from: date).uppercased()
         }
     }
     
@@ -144,14 +149,14 @@ struct SidebarView: View {
         
         Task {
             let groupedByDate = await Task.detached {
-                self.groupSessionsByDate(sessions: sessions)
+                self.groupSessionsByDate(sessions: sessions, favoriteIds: favoriteIds)
             }.value
             
             let favoriteSessions = await Task.detached {
                 sessions.filter { favoriteIds.contains($0.id) }
                     .sorted { s1, s2 in
-                        guard let date1 = Self.iso8601Formatter.date(from: s1.updatedAt),
-                              let date2 = Self.iso8601Formatter.date(from: s2.updatedAt) else {
+                        guard let date1 = s1.updatedDate,
+                              let date2 = s2.updatedDate else {
                             return false
                         }
                         return date1 > date2
@@ -553,7 +558,7 @@ struct SessionRowView: View {
             // Time and message count container - NEVER wraps or truncates
             HStack(spacing: 8) {
                 // Time ago with wider fixed width for AM/PM format
-                Text(formatTime(session.updatedAt))
+                Text(formatTime(session.updatedDate))
                     .font(.system(size: 13))
                     .foregroundColor(.secondary)
                     .frame(width: 65, alignment: .trailing)  // Fits "XX:XX AM"
@@ -586,18 +591,20 @@ struct SessionRowView: View {
         .frame(height: 44)  // Fixed height to prevent expansion
     }
 
-    private func formatTime(_ isoDate: String) -> String {
-        let formatter = ISO8601DateFormatter()
-        formatter.formatOptions = [.withInternetDateTime]
-        
-        guard let date = formatter.date(from: isoDate) else {
+    // Static time formatter to avoid recreating per row
+    private static let timeFormatter: DateFormatter = {
+        let formatter = DateFormatter()
+        formatter.timeStyle = .short
+        return formatter
+    }()
+
+    private func formatTime(_ date: Date?) -> String {
+        guard let date = date else {
             return "Unknown"
         }
         
         // Just show time for same-day sessions
-        let timeFormatter = DateFormatter()
-        timeFormatter.timeStyle = .short
-        return timeFormatter.string(from: date)
+        return Self.timeFormatter.string(from: date)
     }
 }
 
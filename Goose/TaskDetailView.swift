@@ -40,13 +40,18 @@ struct TaskDetailView: View {
         return ""
     }
     
-    // Format timestamp
-    private func formatTimestamp(_ timestamp: Int64) -> String {
-        let date = Date(timeIntervalSince1970: TimeInterval(timestamp) / 1000)
+    // Static timestamp formatter to avoid recreating on every render
+    private static let timestampFormatter: DateFormatter = {
         let formatter = DateFormatter()
         formatter.dateStyle = .medium
         formatter.timeStyle = .short
-        return formatter.string(from: date)
+        return formatter
+    }()
+    
+    // Format timestamp
+    private func formatTimestamp(_ timestamp: Int64) -> String {
+        let date = Date(timeIntervalSince1970: TimeInterval(timestamp) / 1000)
+        return Self.timestampFormatter.string(from: date)
     }
     
     var body: some View {
@@ -226,13 +231,18 @@ struct TaskOutputDetailView: View {
     @State private var currentMatchIndex: Int = 0
     @State private var outputLines: [String] = []
     
-    // Format timestamp
-    private func formatTimestamp(_ timestamp: Int64) -> String {
-        let date = Date(timeIntervalSince1970: TimeInterval(timestamp) / 1000)
+    // Static timestamp formatter to avoid recreating on every render
+    private static let timestampFormatter: DateFormatter = {
         let formatter = DateFormatter()
         formatter.dateStyle = .medium
         formatter.timeStyle = .short
-        return formatter.string(from: date)
+        return formatter
+    }()
+    
+    // Format timestamp
+    private func formatTimestamp(_ timestamp: Int64) -> String {
+        let date = Date(timeIntervalSince1970: TimeInterval(timestamp) / 1000)
+        return Self.timestampFormatter.string(from: date)
     }
     
     // Search functionality
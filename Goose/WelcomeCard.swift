@@ -75,10 +75,7 @@ struct WelcomeCard: View {
         let targetDate = calendar.date(byAdding: .day, value: -daysOffset, to: Date()) ?? Date()
         
         let daySessions = sessions.filter { session in
-            let formatter = ISO8601DateFormatter()
-            formatter.formatOptions = [.withInternetDateTime]
-            
-            guard let sessionDate = formatter.date(from: session.updatedAt) else {
+            guard let sessionDate = session.updatedDate else {
                 return false
             }
             
@@ -96,6 +93,19 @@ struct WelcomeCard: View {
         }
     }
     
+    // Static formatters to avoid recreating on every render
+    private static let weekdayFormatter: DateFormatter = {
+        let formatter = DateFormatter()
+        formatter.dateFormat = "EEEE" // Full day name (e.g., "Monday")
+        return formatter
+    }()
+    
+    private static let mediumDateFormatter: DateFormatter = {
+        let formatter = DateFormatter()
+        formatter.dateStyle = .medium
+        return formatter
+    }()
+    
     // Computed property for day-aware greeting with density awareness
     private var greeting: String {
         let calendar = Calendar.current  // Use local timezone
@@ -131,9 +141,7 @@ struct WelcomeCard: View {
                 }
             } else {
                 // Other days - show day of week
-                let formatter = DateFormatter()
-                formatter.dateFormat = "EEEE" // Full day name (e.g., "Monday")
-                return formatter.string(from: targetDate)
+                return Self.weekdayFormatter.string(from: targetDate)
             }
         }
     }
@@ -144,9 +152,7 @@ struct WelcomeCard: View {
         } else {
             let calendar = Calendar.current
             let targetDate = calendar.date(byAdding: .day, value: -daysOffset, to: Date()) ?? Date()
-            let formatter = DateFormatter()
-            formatter.dateStyle = .medium
-            return "Viewing \(formatter.string(from: targetDate))"
+            return "Viewing \(Self.mediumDateFormatter.string(from: targetDate))"
         }
     }
     
@@ -461,12 +461,16 @@ struct WelcomeSessionRowView: View {
     let session: ChatSession
     @Environment(\.colorScheme) var colorScheme
     
-    var formattedTimestamp: String {
-        // Parse the ISO8601 date string
+    // Static ISO8601 formatter to avoid recreating per row
+    private static let iso8601Formatter: ISO8601DateFormatter = {
         let formatter = ISO8601DateFormatter()
         formatter.formatOptions = [.withInternetDateTime, .withFractionalSeconds]
-        
-        guard let sessionDate = formatter.date(from: session.updatedAt) else {
+        return formatter
+    }()
+    
+    var formattedTimestamp: String {
+        // Parse the ISO8601 date string
+        guard let sessionDate = Self.iso8601Formatter.date(from: session.updatedAt) else {
             return session.updatedAt
         }
         